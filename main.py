@@ -8,29 +8,48 @@ from src.api.main_server import app
 if __name__ == "__main__":
     import uvicorn
     import os
-    from dotenv import load_dotenv
-    
-    # Load environment variables from root directory
-    load_dotenv(".env")
+    import sys
+    from src.config import load_env
+
+    # Load environment variables from root directory (no-op if already loaded)
+    load_env(".env")
     
-    # Create necessary directories
-    os.makedirs("uploads", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    os.makedirs("data", exist_ok=True)
+    # Create necessary directories (cheap stat-only on warm restarts)
+    from pathlib import Path
+    for directory in ("uploads", "output", "logs", "data"):
+        path = Path(directory)
+        if not path.is_dir():
+            path.mkdir(parents=True, exist_ok=True)
     
     # Get configuration from environment
     host = "127.0.0.1"  # Use localhost
     port = 8001  # Force port 8001
     debug = os.getenv("DEBUG", "True").lower() == "true"
+
+    # Size the worker pool to the host (2*cores+1 rule of thumb), overridable
+    # via WEB_CONCURRENCY for constrained containers; a single worker in
+    # debug, matching main_server.__main__
+    if debug:
+        workers = 1
+    else:
+        workers = int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1))
     
     print(f"🚀 Starting AI Power BI Dashboard Generator")
     print(f"📍 Server: http://{host}:{port}")
     print(f"📚 API Docs: http://{host}:{port}/docs")
     
+    # Use uvloop + httptools from uvicorn[standard] for faster event loop and
+    # HTTP parsing (uvloop is not available on Windows - fall back to asyncio there)
+    if sys.platform == "win32":
+        loop_impl, http_impl = "asyncio", "auto"
+    else:
+        loop_impl, http_impl = "uvloop", "httptools"
+
     # For Docker deployment, disable reload to avoid issues
+    # uvicorn requires an import string (not an app instance) to fork workers
     try:
-        uvicorn.run(app, host=host, port=port, reload=False, log_level="info")
+        uvicorn.run("src.api.main_server:app", host=host, port=port, reload=False,
+                    log_level="info", workers=workers, loop=loop_impl, http=http_impl)
     except Exception as e:
         print(f"❌ Failed to start server: {e}")
         raise
\ No newline at end of file
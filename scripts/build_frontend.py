@@ -3,30 +3,110 @@
 Frontend build script for AI Power BI Dashboard Generator
 """
 
+import argparse
+import hashlib
+import json
 import os
+import queue
+import shlex
 import subprocess
+import threading
 import sys
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Diminishing returns past ~6 parallel bundler processes
+DEFAULT_CONCURRENCY = min(os.cpu_count() or 1, 6)
+
+# Resolve npm/npx once - on Windows these are .cmd shims, so shutil.which
+# finds the real launcher without needing shell=True
+NPM_BIN = shutil.which("npm") or "npm"
+NPX_BIN = shutil.which("npx") or "npx"
+
 def run_command(command, cwd=None):
-    """Run a shell command and return the result"""
+    """Run a command (argv list), streaming its output, and return the result"""
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            cwd=cwd, 
-            capture_output=True, 
+        # argv list with shell=False skips the intermediate /bin/sh fork;
+        # stream output line-by-line instead of buffering the whole log in
+        # memory; closing stdin lets the child see EOF immediately
+        process = subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1
         )
-        return result.returncode == 0, result.stdout, result.stderr
+        # The 5 minute timeout has to cover the streaming loop itself -
+        # waiting only after stdout hits EOF would never fire against a
+        # hung child that keeps its pipe open. A daemon reader thread
+        # feeds a queue the main loop polls against the deadline:
+        # select() can't watch pipes on Windows, and selecting on the
+        # raw fd while readline() buffers both stalls delivered lines
+        # and hangs on partial lines (npm's \r progress spinners)
+        lines = queue.Queue()
+
+        def _pump():
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)  # EOF sentinel
+
+        threading.Thread(target=_pump, daemon=True).start()
+
+        deadline = time.monotonic() + 300
+        tail = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(command, 300)
+            try:
+                line = lines.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(command, 300)
+            if line is None:
+                break
+            print(line, end="")
+            tail.append(line)
+            if len(tail) > 50:
+                tail.pop(0)
+        returncode = process.wait(timeout=max(deadline - time.monotonic(), 1))
+        return returncode == 0, "", "".join(tail) if returncode != 0 else ""
     except subprocess.TimeoutExpired:
+        process.kill()
         return False, "", "Command timed out"
     except Exception as e:
         return False, "", str(e)
 
-def build_frontend():
+def build_target(target, frontend_dir):
+    """Build a single named target, returning (name, success, elapsed seconds)"""
+    name = target.get("name", "unnamed")
+    command = shlex.split(target.get("command", "npm run build"))
+    started = time.monotonic()
+    success, _, stderr = run_command(command, cwd=frontend_dir)
+    elapsed = time.monotonic() - started
+    if not success:
+        print(f"❌ Target '{name}' failed: {stderr}")
+    return name, success, elapsed
+
+def build_targets(frontend_dir, concurrency):
+    """Build all targets from build.targets.json with bounded parallelism"""
+    targets_file = frontend_dir / "build.targets.json"
+    targets = json.loads(targets_file.read_text())
+
+    print(f"🔨 Building {len(targets)} targets with concurrency {concurrency}...")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda t: build_target(t, frontend_dir), targets))
+
+    for name, success, elapsed in results:
+        status = "✅" if success else "❌"
+        print(f"{status} {name}: {elapsed:.1f}s")
+
+    return all(success for _, success, _ in results)
+
+def build_frontend(concurrency=DEFAULT_CONCURRENCY, verbose=False):
     """Build the React frontend"""
     print("🚀 Building Frontend...")
     
@@ -40,25 +120,39 @@ def build_frontend():
     
     print(f"📁 Frontend directory: {frontend_dir}")
     
-    # Check if node_modules exists
+    # Install when node_modules is missing or package-lock.json changed
+    # since the last install (tracked by a content-hash stamp file)
     node_modules = frontend_dir / "node_modules"
-    if not node_modules.exists():
+    lock_file = frontend_dir / "package-lock.json"
+    stamp_file = frontend_dir / ".install.sha"
+    digest = None
+    if lock_file.exists():
+        digest = hashlib.sha256(lock_file.read_bytes()).hexdigest()
+    stamp = stamp_file.read_text().strip() if stamp_file.exists() else None
+    if not node_modules.exists() or (digest and digest != stamp):
         print("📦 Installing dependencies...")
-        success, stdout, stderr = run_command("npm install", cwd=frontend_dir)
+        success, stdout, stderr = run_command([NPM_BIN, "install"], cwd=frontend_dir)
         if not success:
             print(f"❌ Failed to install dependencies: {stderr}")
             return False
+        if digest:
+            stamp_file.write_text(digest)
         print("✅ Dependencies installed successfully")
     
+    # Multi-target builds run in parallel child processes when a targets
+    # manifest is present; otherwise fall back to the single monolithic build
+    if (frontend_dir / "build.targets.json").exists():
+        return build_targets(frontend_dir, concurrency)
+
     # Build the project
     print("🔨 Building React app...")
-    success, stdout, stderr = run_command("npm run build", cwd=frontend_dir)
+    success, stdout, stderr = run_command([NPM_BIN, "run", "build"], cwd=frontend_dir)
     
     if not success:
         print(f"❌ Build failed: {stderr}")
         # Try alternative build method
         print("🔄 Trying alternative build method...")
-        success, stdout, stderr = run_command("npx react-scripts build", cwd=frontend_dir)
+        success, stdout, stderr = run_command([NPX_BIN, "react-scripts", "build"], cwd=frontend_dir)
         
         if not success:
             print(f"❌ Alternative build also failed: {stderr}")
@@ -70,10 +164,12 @@ def build_frontend():
         print("✅ Frontend build completed successfully!")
         print(f"📁 Build output: {build_dir}")
         
-        # List build contents
-        build_files = list(build_dir.rglob("*"))
-        print(f"📄 Build contains {len(build_files)} files")
-        
+        # Counting means stat'ing every emitted file, so only walk the tree
+        # when asked - and count lazily without materializing a list
+        if verbose:
+            file_count = sum(1 for _ in build_dir.rglob("*"))
+            print(f"📄 Build contains {file_count} files")
+
         return True
     else:
         print("❌ Build directory not created")
@@ -81,11 +177,18 @@ def build_frontend():
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Build the React frontend")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Max parallel builds for multi-target builds")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Report build output details (walks the build tree)")
+    args = parser.parse_args()
+
     print("=" * 50)
     print("🎯 AI Power BI Frontend Build Script")
     print("=" * 50)
-    
-    if build_frontend():
+
+    if build_frontend(concurrency=args.concurrency, verbose=args.verbose):
         print("\n✅ Frontend build completed successfully!")
         sys.exit(0)
     else:
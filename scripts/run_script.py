@@ -4,13 +4,65 @@ AI Power BI Dashboard Generator - Run Script
 Simple script to start the complete system with proper configuration checking.
 """
 
+import asyncio
 import os
-import sys
+import shutil
+import signal
+import socket
 import subprocess
+import sys
 import time
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
-import threading
+
+# Allow importing src.config when run as "python scripts/run_script.py"
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import get_env
+
+# Resolve tool paths once at import - later calls reuse the constants
+# instead of rebuilding the platform-specific strings per invocation
+PYTHON_BIN = Path("venv") / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+NPM_BIN = shutil.which("npm") or "npm"
+
+# Template values from .env.example - a value is only "configured" when it
+# is non-empty and not one of these
+PLACEHOLDERS = frozenset({
+    "your_openai_api_key_here",
+    "your_anthropic_api_key_here",
+    "your_azure_tenant_id",
+    "your_azure_app_client_id",
+    "your_azure_app_client_secret",
+    "your_powerbi_username",
+    "your_powerbi_password",
+    "your_secret_key_here",
+})
+
+def _is_real(value):
+    """True when an env value is set and not a template placeholder"""
+    return bool(value) and value.strip() not in PLACEHOLDERS
+
+@lru_cache(maxsize=1)
+def _venv_python_exists():
+    """Stat the venv interpreter once and cache the answer for this run"""
+    return PYTHON_BIN.is_file()
+
+@lru_cache(maxsize=1)
+def _venv_deps_ok(_venv_mtime_ns):
+    """Probe the venv interpreter for the core dependencies
+
+    This script runs under the system Python but launches the app with
+    PYTHON_BIN, so checking find_spec here would look in the wrong
+    environment. One cached subprocess probe, keyed on the venv's mtime
+    so a fresh 'pip install' invalidates the answer.
+    """
+    result = subprocess.run(
+        [str(PYTHON_BIN), "-c", "import fastapi, openai, pandas"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True
+    )
+    return result.returncode == 0
 
 def print_banner():
     """Print application banner"""
@@ -23,7 +75,9 @@ def print_banner():
 ║                                                               ║
 ╚═══════════════════════════════════════════════════════════════╝
     """
-    print(banner)
+    # One write + flush instead of a locked/flushed print per line
+    sys.stdout.write(banner + "\n")
+    sys.stdout.flush()
 
 def check_environment():
     """Check if environment is properly set up"""
@@ -32,26 +86,15 @@ def check_environment():
     issues = []
     
     # Check if virtual environment exists
-    if not Path("venv").exists():
+    if not _venv_python_exists():
         issues.append("Virtual environment not found. Run 'python setup.py' first.")
-    
-    # Check if requirements are installed
-    if Path("venv").exists():
+
+    # Check if requirements are installed in the venv
+    if _venv_python_exists():
         try:
-            if os.name == 'nt':  # Windows
-                result = subprocess.run(
-                    "venv\\Scripts\\python -c \"import fastapi, openai, pandas\"",
-                    shell=True, capture_output=True, text=True
-                )
-            else:  # Unix/Linux/macOS
-                result = subprocess.run(
-                    "venv/bin/python -c \"import fastapi, openai, pandas\"",
-                    shell=True, capture_output=True, text=True
-                )
-            
-            if result.returncode != 0:
+            if not _venv_deps_ok(PYTHON_BIN.stat().st_mtime_ns):
                 issues.append("Python dependencies not installed. Run 'python setup.py' first.")
-        except:
+        except Exception:
             issues.append("Cannot verify Python dependencies.")
     
     # Check if .env file exists
@@ -81,19 +124,13 @@ def check_api_keys():
         print("❌ No .env file found")
         return False
     
-    # Read .env file
-    env_vars = {}
-    with open(".env", "r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                env_vars[key.strip()] = value.strip()
-    
+    # Parse .env once (cached across calls)
+    env_vars = {k: v or "" for k, v in get_env().items()}
+
     # Check for AI API keys
-    has_openai = env_vars.get("OPENAI_API_KEY", "").replace("your_openai_api_key_here", "").strip()
-    has_anthropic = env_vars.get("ANTHROPIC_API_KEY", "").replace("your_anthropic_api_key_here", "").strip()
-    
+    has_openai = _is_real(env_vars.get("OPENAI_API_KEY"))
+    has_anthropic = _is_real(env_vars.get("ANTHROPIC_API_KEY"))
+
     if not has_openai and not has_anthropic:
         print("❌ No AI API keys configured!")
         print("   Please add either OPENAI_API_KEY or ANTHROPIC_API_KEY to your .env file")
@@ -106,11 +143,10 @@ def check_api_keys():
         print("✅ Anthropic API key configured")
     
     # Check Power BI configuration
-    has_powerbi = all([
-        env_vars.get("POWER_BI_TENANT_ID", "").replace("your_azure_tenant_id", "").strip(),
-        env_vars.get("POWER_BI_CLIENT_ID", "").replace("your_azure_app_client_id", "").strip(),
-        env_vars.get("POWER_BI_CLIENT_SECRET", "").replace("your_azure_app_client_secret", "").strip()
-    ])
+    has_powerbi = all(
+        _is_real(env_vars.get(key))
+        for key in ("POWER_BI_TENANT_ID", "POWER_BI_CLIENT_ID", "POWER_BI_CLIENT_SECRET")
+    )
     
     if has_powerbi:
         print("✅ Power BI credentials configured - Real dashboards will be created!")
@@ -121,104 +157,98 @@ def check_api_keys():
     
     return True
 
-def start_backend():
+async def _wait_for_port(process, port, timeout=55.0):
+    """Probe a TCP port with exponential backoff until it accepts connections
+
+    Detects readiness the moment the server binds - no log-line scanning -
+    and bails out early if the child process dies while we wait.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        if process.returncode is not None:
+            return False
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.2)
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return True
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.8)
+    return False
+
+async def start_backend():
     """Start the backend server"""
     print("🚀 Starting backend server...")
-    
+
     try:
-        # Set environment variables
-        env = os.environ.copy()
-        if Path(".env").exists():
-            with open(".env", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        env[key.strip()] = value.strip()
-        
-        # Start the server
-        if os.name == 'nt':  # Windows
-            cmd = "venv\\Scripts\\python main.py"
-        else:  # Unix/Linux/macOS
-            cmd = "venv/bin/python main.py"
-        
-        process = subprocess.Popen(
-            cmd,
-            shell=True,
-            env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Monitor output
-        backend_ready = False
-        for line in iter(process.stdout.readline, ''):
-            print(f"[Backend] {line.strip()}")
-            if "Application startup complete" in line or "Uvicorn running on" in line:
-                backend_ready = True
-                break
-            if process.poll() is not None:
-                break
-        
-        if backend_ready:
+        # Send the server's output straight to a log file - no PIPE to
+        # drain, so there's no risk of the child blocking on a full pipe
+        Path("logs").mkdir(exist_ok=True)
+        with open("logs/backend.log", "a") as log_file:
+            # argv list avoids the intermediate /bin/sh fork; the child
+            # inherits os.environ (populated once in main)
+            process = await asyncio.create_subprocess_exec(
+                str(PYTHON_BIN), "main.py",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=asyncio.subprocess.STDOUT
+            )
+
+        if await _wait_for_port(process, 8001):
             print("✅ Backend server is running!")
             return process
-        else:
-            print("❌ Backend failed to start")
-            return None
-            
+
+        print("❌ Backend failed to start (see logs/backend.log)")
+        return None
+
     except Exception as e:
         print(f"❌ Error starting backend: {e}")
         return None
 
-def start_frontend():
+async def start_frontend():
     """Start the frontend development server"""
     print("⚛️  Starting frontend server...")
-    
+
     try:
         if not Path("frontend").exists():
             print("⚠️  Frontend directory not found, skipping frontend startup")
             return None
-        
-        process = subprocess.Popen(
-            "npm start",
-            shell=True,
-            cwd="frontend",
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
-        )
-        
-        # Monitor output
-        frontend_ready = False
-        for line in iter(process.stdout.readline, ''):
-            print(f"[Frontend] {line.strip()}")
-            if "webpack compiled" in line.lower() or "compiled successfully" in line.lower():
-                frontend_ready = True
-                break
-            if "Local:" in line and "http://localhost:3000" in line:
-                frontend_ready = True
-                break
-            if process.poll() is not None:
-                break
-        
-        if frontend_ready:
+
+        Path("logs").mkdir(exist_ok=True)
+        with open("logs/frontend.log", "a") as log_file:
+            process = await asyncio.create_subprocess_exec(
+                NPM_BIN, "start",
+                cwd="frontend",
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=asyncio.subprocess.STDOUT
+            )
+
+        if await _wait_for_port(process, 3000):
             print("✅ Frontend server is running!")
             return process
-        else:
-            print("❌ Frontend failed to start")
-            return None
-            
+
+        print("❌ Frontend failed to start (see logs/frontend.log)")
+        return None
+
     except Exception as e:
         print(f"❌ Error starting frontend: {e}")
         return None
 
+async def start_services():
+    """Start backend and frontend concurrently, bounded by a startup timeout"""
+    tasks = [asyncio.wait_for(start_backend(), timeout=60)]
+    if Path("frontend").exists():
+        tasks.append(asyncio.wait_for(start_frontend(), timeout=60))
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    processes = [r if not isinstance(r, BaseException) else None for r in results]
+    backend = processes[0]
+    frontend = processes[1] if len(processes) > 1 else None
+    return backend, frontend
+
 def open_browser():
     """Open browser to the application"""
-    time.sleep(3)  # Wait a bit for servers to fully start
     print("🌐 Opening browser...")
     try:
         webbrowser.open("http://localhost:3000")
@@ -228,93 +258,99 @@ def open_browser():
 def main():
     """Main function"""
     print_banner()
-    
+
+    # Push .env into os.environ once - every later subprocess inherits it
+    # for free instead of getting a hand-built env= mapping per spawn
+    if Path(".env").exists():
+        os.environ.update({k: v for k, v in get_env().items() if v is not None})
+
     # Check if setup is complete
     if not check_environment():
         sys.exit(1)
     
-    # Check API keys - exit if not configured
-    if not check_api_keys():
+    # Check API keys once - exit if not configured
+    api_keys_ok = check_api_keys()
+    if not api_keys_ok:
         print("\n❌ Cannot start system without proper configuration!")
         print("Please configure your .env file with required API keys.")
         sys.exit(1)
-    
-    print("\n" + "="*60)
-    print("🚀 Starting AI Power BI Dashboard Generator")
-    print("="*60)
-    
-    # Start backend
-    backend_process = start_backend()
+
+    sys.stdout.write("\n" + "="*60 + "\n🚀 Starting AI Power BI Dashboard Generator\n" + "="*60 + "\n")
+    sys.stdout.flush()
+
+    # Start both servers concurrently and supervise the backend
+    asyncio.run(supervise(api_keys_ok))
+
+async def supervise(api_keys_ok=True):
+    """Start backend and frontend together, then block until the backend exits"""
+    backend_process, frontend_process = await start_services()
     if not backend_process:
         print("❌ Cannot start without backend server")
         sys.exit(1)
-    
-    # Start frontend in a separate thread
-    frontend_process = None
-    if Path("frontend").exists():
-        frontend_thread = threading.Thread(target=lambda: globals().update({'frontend_process': start_frontend()}))
-        frontend_thread.daemon = True
-        frontend_thread.start()
-        
-        # Wait a bit for frontend to start
-        time.sleep(5)
-    
-    # Open browser
-    browser_thread = threading.Thread(target=open_browser)
-    browser_thread.daemon = True
-    browser_thread.start()
-    
-    print("\n" + "="*60)
-    print("🎉 AI Power BI Dashboard Generator is running!")
-    print("="*60)
-    print("\n📍 Access URLs:")
-    print("   • Frontend App: http://localhost:3000")
-    print("   • Backend API:  http://localhost:8000")
-    print("   • API Docs:     http://localhost:8000/docs")
-    
-    print("\n💡 How to use:")
-    print("   1. Open http://localhost:3000 in your browser")
-    print("   2. Upload your data files (Excel, CSV, JSON)")
-    print("   3. Chat with AI to create your dashboard!")
-    print("   4. Example: 'Create a sales dashboard with monthly trends'")
-    
-    print("\n⚠️  Notes:")
-    if not check_api_keys():
-        print("   • Configure API keys in .env for full AI functionality")
-    print("   • Press Ctrl+C to stop all services")
-    print("   • Check logs if you encounter any issues")
-    
-    print("\n🔄 System Status:")
-    print(f"   • Backend:  ✅ Running on port 8000")
-    if Path("frontend").exists():
-        print(f"   • Frontend: ✅ Running on port 3000")
-    else:
-        print(f"   • Frontend: ⚠️  Not available")
-    
-    try:
-        # Keep the script running
-        print("\n" + "="*60)
-        print("Press Ctrl+C to stop all services...")
-        while True:
-            time.sleep(1)
-            # Check if backend is still running
-            if backend_process.poll() is not None:
-                print("❌ Backend process stopped unexpectedly")
-                break
-                
-    except KeyboardInterrupt:
+
+    # start_frontend only returns once the dev server reports it compiled,
+    # so the browser can open immediately - no blind 3-second sleep thread
+    # and no race against an unready frontend
+    if frontend_process:
+        open_browser()
+
+    # Assemble the whole status block and emit it with a single write -
+    # one stdout lock/flush instead of ~25 (each print is a separate
+    # syscall under journald)
+    separator = "=" * 60
+    api_note = "   • Configure API keys in .env for full AI functionality\n" if not api_keys_ok else ""
+    frontend_status = "   • Frontend: ✅ Running on port 3000" if Path("frontend").exists() else "   • Frontend: ⚠️  Not available"
+    status_block = f"""
+{separator}
+🎉 AI Power BI Dashboard Generator is running!
+{separator}
+
+📍 Access URLs:
+   • Frontend App: http://localhost:3000
+   • Backend API:  http://localhost:8000
+   • API Docs:     http://localhost:8000/docs
+
+💡 How to use:
+   1. Open http://localhost:3000 in your browser
+   2. Upload your data files (Excel, CSV, JSON)
+   3. Chat with AI to create your dashboard!
+   4. Example: 'Create a sales dashboard with monthly trends'
+
+⚠️  Notes:
+{api_note}   • Press Ctrl+C to stop all services
+   • Check logs if you encounter any issues
+
+🔄 System Status:
+   • Backend:  ✅ Running on port 8000
+{frontend_status}
+"""
+    sys.stdout.write(status_block)
+    sys.stdout.flush()
+
+    def _graceful_stop(signum, frame):
         print("\n\n🛑 Stopping services...")
-        
+
         # Terminate processes
         if backend_process:
             backend_process.terminate()
             print("✅ Backend stopped")
-        
+
         if frontend_process:
             frontend_process.terminate()
             print("✅ Frontend stopped")
-        
+
         print("👋 Thanks for using AI Power BI Dashboard Generator!")
+        sys.exit(0)
+
+    signal.signal(signal.SIGINT, _graceful_stop)
+
+    sys.stdout.write("\n" + "="*60 + "\nPress Ctrl+C to stop all services...\n")
+    sys.stdout.flush()
+
+    # Block until the backend exits - no periodic wakeups, and a crashed
+    # child is detected immediately instead of up to 1s later
+    await backend_process.wait()
+    print("❌ Backend process stopped unexpectedly")
 
 if __name__ == "__main__":
     main()
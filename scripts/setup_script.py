@@ -4,29 +4,66 @@ AI Power BI Dashboard Generator - Setup Script
 This script sets up the complete environment for the AI Power BI system.
 """
 
+import collections
+import hashlib
 import os
 import sys
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import SimpleNamespace
 
-def run_command(command, cwd=None, description=""):
-    """Run a command and handle errors"""
-    print(f"🔄 {description or f'Running: {command}'}")
+# Platform facts resolved once at import - every function reads these
+# instead of re-branching on os.name and rebuilding path strings
+PLAT = SimpleNamespace(is_win=(os.name == 'nt'))
+PLAT.bin_dir = Path("venv") / ("Scripts" if PLAT.is_win else "bin")
+PLAT.pip = PLAT.bin_dir / ("pip.exe" if PLAT.is_win else "pip")
+PLAT.python = PLAT.bin_dir / ("python.exe" if PLAT.is_win else "python")
+
+# Shared wheel cache so re-runs (and CI with this directory mounted) hit
+# local wheels instead of recompiling sdists or re-downloading from PyPI
+WHEEL_CACHE = os.environ.get("AI_PBI_WHEEL_CACHE", str(Path.home() / ".cache" / "ai-pbi-wheels"))
+
+# Every directory the setup needs - created in one sweep; parents=True
+# covers the intermediates so nested paths don't need separate mkdir calls
+DIRS = ("uploads", "output", "logs", "data", "frontend/src", "frontend/public")
+
+def _listing(root):
+    """Snapshot a directory's entry names with a single scandir pass"""
+    return {e.name for e in os.scandir(root)} if os.path.isdir(root) else set()
+
+def run_command(argv, cwd=None, description=""):
+    """Run a command (argv list) and handle errors"""
+    label = description or f"Running: {' '.join(argv)}"
+    print(f"🔄 {label}")
     try:
-        result = subprocess.run(
-            command, 
-            shell=True, 
-            cwd=cwd, 
-            check=True, 
-            capture_output=True, 
-            text=True
+        # argv with shell=False skips the /bin/sh fork; streaming stdout
+        # line-by-line keeps long installs from buffering their whole log
+        # in memory the way capture_output did
+        process = subprocess.Popen(
+            argv,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
         )
-        print(f"✅ Success: {description or command}")
-        return result.stdout
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error: {description or command}")
-        print(f"   Error output: {e.stderr}")
+        # Bounded tail: long pip/npm installs can emit tens of MB, so only
+        # the last 200 lines are retained for error reporting
+        tail = collections.deque(maxlen=200)
+        for line in process.stdout:
+            print(line, end="")
+            tail.append(line)
+        if process.wait() != 0:
+            print(f"❌ Error: {description or ' '.join(argv)}")
+            print(f"   Last output:\n{''.join(tail)}")
+            return None
+        print(f"✅ Success: {description or ' '.join(argv)}")
+        return "".join(tail)
+    except FileNotFoundError:
+        print(f"❌ Error: {argv[0]} not found")
         return None
 
 def check_python():
@@ -41,7 +78,7 @@ def check_python():
 def check_node():
     """Check Node.js installation"""
     print("📦 Checking Node.js...")
-    result = run_command("node --version", description="Checking Node.js version")
+    result = run_command(["node", "--version"], description="Checking Node.js version")
     if result is None:
         print("❌ Node.js is not installed. Please install Node.js 16+ from https://nodejs.org/")
         return False
@@ -55,42 +92,65 @@ def create_virtual_environment():
     if os.path.exists("venv"):
         print("✅ Virtual environment already exists")
         return True
-    
-    result = run_command(
-        "python -m venv venv", 
-        description="Creating virtual environment"
-    )
-    return result is not None
+
+    try:
+        # Build the venv in-process - saves the shell fork plus a full
+        # interpreter boot compared to spawning "python -m venv"
+        import venv
+        venv.EnvBuilder(
+            with_pip=True,
+            symlinks=not PLAT.is_win,
+            upgrade_deps=False
+        ).create("venv")
+        print("✅ Success: Creating virtual environment")
+        return True
+    except Exception as e:
+        print(f"❌ Error creating virtual environment: {e}")
+        return False
 
 def install_python_dependencies():
     """Install Python dependencies"""
     print("📚 Installing Python dependencies...")
-    
-    # Activate virtual environment and install requirements
-    if os.name == 'nt':  # Windows
-        pip_cmd = "venv\\Scripts\\pip install -r requirements.txt"
-    else:  # Unix/Linux/macOS
-        pip_cmd = "source venv/bin/activate && pip install -r requirements.txt"
-    
-    result = run_command(
-        pip_cmd,
-        description="Installing Python packages"
+
+    # Invoke the venv's pip binary directly - no subshell activation needed
+    pip_bin = str(PLAT.pip)
+
+    # Upgrade pip and install wheel once so pip's wheel cache works, then
+    # prefer prebuilt wheels to skip sdist compilation on re-runs
+    bootstrap = subprocess.run(
+        [pip_bin, "install", "--upgrade", "--cache-dir", WHEEL_CACHE, "pip", "wheel"],
+        stdin=subprocess.DEVNULL,
+        check=False
     )
-    return result is not None
+    if bootstrap.returncode != 0:
+        print("❌ Error: Upgrading pip and wheel")
+        return False
+
+    # check=False: a failed install is an expected branch handled via the
+    # return code, not worth a CalledProcessError construction
+    result = subprocess.run(
+        [pip_bin, "install", "--cache-dir", WHEEL_CACHE, "--prefer-binary",
+         "-r", "requirements.txt"],
+        stdin=subprocess.DEVNULL,
+        check=False
+    )
+    if result.returncode != 0:
+        print("❌ Error: Installing Python packages")
+        return False
+    print("✅ Success: Installing Python packages")
+    return True
 
 def setup_frontend():
     """Setup React frontend"""
     print("⚛️  Setting up React frontend...")
     
-    # Create frontend directory if it doesn't exist
-    frontend_dir = Path("frontend")
-    if not frontend_dir.exists():
-        frontend_dir.mkdir()
-        print("✅ Created frontend directory")
-    
+    # frontend/ is created by the DIRS sweep in create_directories, but
+    # guard here too since setup_frontend can run first for Node users
+    Path("frontend").mkdir(exist_ok=True)
+
     # Install npm dependencies
     result = run_command(
-        "npm install",
+        [shutil.which("npm") or "npm", "install"],
         cwd="frontend",
         description="Installing Node.js dependencies"
     )
@@ -99,17 +159,12 @@ def setup_frontend():
 def create_directories():
     """Create necessary directories"""
     print("📁 Creating necessary directories...")
-    
-    directories = [
-        "uploads",
-        "output", 
-        "logs",
-        "data"
-    ]
-    
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✅ Created {directory}/ directory")
+
+    # exist_ok=True skips the pre-stat check; one summary line instead of
+    # a log entry per directory
+    for directory in DIRS:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+    print(f"✅ Created {len(DIRS)} directories: {', '.join(DIRS)}")
 
 def setup_environment_file():
     """Setup environment configuration"""
@@ -119,7 +174,9 @@ def setup_environment_file():
     env_file = Path(".env")
     
     if not env_file.exists() and env_example.exists():
-        shutil.copy(env_example, env_file)
+        # copyfile skips copy()'s extra stat+chmod and uses the kernel's
+        # fast copy path (sendfile/copy_file_range) where available
+        shutil.copyfile(env_example, env_file)
         print("✅ Created .env file from template")
         print("📝 Please edit .env file with your API keys and configuration")
     elif env_file.exists():
@@ -161,30 +218,22 @@ LOG_FILE=app.log
 ALLOWED_ORIGINS=http://localhost:3000,http://127.0.0.1:3000
 """)
 
-def create_startup_scripts():
-    """Create startup scripts for easy running"""
-    print("🚀 Creating startup scripts...")
-    
-    # Backend startup script
-    if os.name == 'nt':  # Windows
-        with open("start_backend.bat", "w") as f:
-            f.write("""@echo off
+# (path, content, mode) tables for the generated startup scripts - one
+# write loop handles both platforms instead of duplicated open/write blocks
+STARTUP_SCRIPTS_WIN = [
+    (Path("start_backend.bat"), """@echo off
 echo Starting AI Power BI Backend...
 call venv\\Scripts\\activate
 python main.py
 pause
-""")
-        
-        with open("start_frontend.bat", "w") as f:
-            f.write("""@echo off
+""", None),
+    (Path("start_frontend.bat"), """@echo off
 echo Starting AI Power BI Frontend...
 cd frontend
 npm start
 pause
-""")
-        
-        with open("start_all.bat", "w") as f:
-            f.write("""@echo off
+""", None),
+    (Path("start_all.bat"), """@echo off
 echo Starting AI Power BI Complete System...
 start "Backend" cmd /k start_backend.bat
 timeout /t 3
@@ -193,24 +242,21 @@ echo Both services are starting...
 echo Backend: http://localhost:8000
 echo Frontend: http://localhost:3000
 pause
-""")
-    else:  # Unix/Linux/macOS
-        with open("start_backend.sh", "w") as f:
-            f.write("""#!/bin/bash
+""", None),
+]
+
+STARTUP_SCRIPTS_UNIX = [
+    (Path("start_backend.sh"), """#!/bin/bash
 echo "Starting AI Power BI Backend..."
 source venv/bin/activate
 python main.py
-""")
-        
-        with open("start_frontend.sh", "w") as f:
-            f.write("""#!/bin/bash
+""", 0o755),
+    (Path("start_frontend.sh"), """#!/bin/bash
 echo "Starting AI Power BI Frontend..."
 cd frontend
 npm start
-""")
-        
-        with open("start_all.sh", "w") as f:
-            f.write("""#!/bin/bash
+""", 0o755),
+    (Path("start_all.sh"), """#!/bin/bash
 echo "Starting AI Power BI Complete System..."
 ./start_backend.sh &
 sleep 3
@@ -219,13 +265,33 @@ echo "Both services are starting..."
 echo "Backend: http://localhost:8000"
 echo "Frontend: http://localhost:3000"
 wait
-""")
-        
-        # Make scripts executable
-        os.chmod("start_backend.sh", 0o755)
-        os.chmod("start_frontend.sh", 0o755)
-        os.chmod("start_all.sh", 0o755)
-    
+""", 0o755),
+]
+
+def _write_generated(path, body, mode=None):
+    """Write a generated file, skipping the write when content is unchanged"""
+    data = body.encode()
+    if path.exists() and hashlib.blake2b(path.read_bytes()).digest() == hashlib.blake2b(data).digest():
+        return
+    if mode is not None:
+        # Create the file with its final mode in one open syscall -
+        # no separate chmod after the write
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    else:
+        path.write_text(body)
+
+def create_startup_scripts():
+    """Create startup scripts for easy running"""
+    print("🚀 Creating startup scripts...")
+
+    scripts = STARTUP_SCRIPTS_WIN if PLAT.is_win else STARTUP_SCRIPTS_UNIX
+    for path, body, mode in scripts:
+        _write_generated(path, body, mode)
+
     print("✅ Created startup scripts")
 
 def create_frontend_files():
@@ -235,14 +301,19 @@ def create_frontend_files():
     frontend_dir = Path("frontend")
     src_dir = frontend_dir / "src"
     public_dir = frontend_dir / "public"
-    
-    # Create directories
-    src_dir.mkdir(parents=True, exist_ok=True)
-    public_dir.mkdir(parents=True, exist_ok=True)
-    
+
+    # Directories come from the single DIRS sweep; re-assert the nested
+    # ones here for callers that invoke this before create_directories
+    for d in (src_dir, public_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    # One scandir per parent replaces a stat call per candidate file
+    src_entries = _listing(src_dir)
+    public_entries = _listing(public_dir)
+
     # Create public/index.html
     index_html = public_dir / "index.html"
-    if not index_html.exists():
+    if "index.html" not in public_entries:
         with open(index_html, "w") as f:
             f.write("""<!DOCTYPE html>
 <html lang="en">
@@ -263,7 +334,7 @@ def create_frontend_files():
     
     # Create src/index.js
     index_js = src_dir / "index.js"
-    if not index_js.exists():
+    if "index.js" not in src_entries:
         with open(index_js, "w") as f:
             f.write("""import React from 'react';
 import ReactDOM from 'react-dom/client';
@@ -292,21 +363,29 @@ def main():
     if not create_virtual_environment():
         print("❌ Failed to create virtual environment")
         sys.exit(1)
-    
-    if not install_python_dependencies():
-        print("❌ Failed to install Python dependencies")
-        sys.exit(1)
-    
-    # Setup frontend (only if Node.js is available)
+
+    # pip and npm touch disjoint trees (venv/ vs frontend/node_modules/)
+    # and are both network/IO bound, so overlap them - cold installs take
+    # max(pip, npm) instead of their sum. Both stream output, so neither
+    # can deadlock on a full pipe.
     if node_available:
-        print("\n🔧 Setting up Frontend...")
+        print("\n🔧 Setting up Backend and Frontend dependencies concurrently...")
         create_frontend_files()
-        if not setup_frontend():
-            print("❌ Failed to setup frontend")
-            sys.exit(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                executor.submit(install_python_dependencies): "Python dependencies",
+                executor.submit(setup_frontend): "frontend",
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    print(f"❌ Failed to setup {futures[future]}")
+                    sys.exit(1)
     else:
         print("⚠️  Skipping frontend setup (Node.js not available)")
-    
+        if not install_python_dependencies():
+            print("❌ Failed to install Python dependencies")
+            sys.exit(1)
+
     # Create directories and files
     create_directories()
     setup_environment_file()
@@ -319,7 +398,7 @@ def main():
     print("   - Add your OpenAI or Anthropic API key")
     print("   - Add your Power BI Azure app credentials")
     print("\n2. Start the system:")
-    if os.name == 'nt':
+    if PLAT.is_win:
         print("   - Run start_all.bat to start both backend and frontend")
         print("   - Or run start_backend.bat and start_frontend.bat separately")
     else:
@@ -0,0 +1,68 @@
+"""
+Shared environment configuration for AI Power BI Dashboard Generator
+
+Parses the .env file exactly once per process and caches the result so the
+entry point and helper scripts stop re-reading and re-parsing it.
+"""
+
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+try:
+    from dotenv import dotenv_values, load_dotenv
+except ImportError:
+    # Launcher scripts run under the system Python, which may not have
+    # python-dotenv installed - fall back to a minimal stdlib parser so
+    # they can still read .env and print their setup guidance
+    dotenv_values = None
+    load_dotenv = None
+
+# Tracks whether load_env() has already pushed .env into os.environ
+_env_loaded = False
+
+
+@lru_cache(maxsize=1)
+def get_env(env_file: str = ".env") -> Dict[str, Optional[str]]:
+    """
+    Parse the .env file once and return its key/value pairs.
+
+    Subsequent calls return the cached dict without touching the filesystem.
+    """
+    if dotenv_values is not None:
+        return dict(dotenv_values(env_file))
+    return _parse_env_file(env_file)
+
+
+def _parse_env_file(env_file: str) -> Dict[str, Optional[str]]:
+    """
+    Minimal KEY=value .env parser used when python-dotenv is unavailable.
+    """
+    values: Dict[str, Optional[str]] = {}
+    if not os.path.exists(env_file):
+        return values
+    with open(env_file, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            values[key.strip()] = value.strip().strip('"').strip("'")
+    return values
+
+
+def load_env(env_file: str = ".env") -> None:
+    """
+    Load .env into os.environ, skipping the file read if already loaded.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    if load_dotenv is not None:
+        load_dotenv(env_file)
+    else:
+        # Same semantics as load_dotenv: existing os.environ entries win
+        for key, value in _parse_env_file(env_file).items():
+            if value is not None:
+                os.environ.setdefault(key, value)
+    _env_loaded = True
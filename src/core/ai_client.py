@@ -1,20 +1,185 @@
+import aiohttp
+import httpx
 import openai
+import orjson
 import asyncio
 import json
+import mmap
 import os
 import re
-import requests
-import base64
+import time
+from cachetools import TTLCache
+from functools import lru_cache
 from typing import Dict, List, Optional
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 import logging
 from datetime import datetime
 
+# pybase64 dispatches to SIMD encoders at runtime - several times faster
+# than stdlib base64 on multi-MB screenshots; fall back silently
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Optional lossy pre-compression: downscale + JPEG-re-encode oversized
+# lossless screenshots before base64. Cuts upload bytes and vision
+# tokens dramatically, but changes the image slightly - so it's opt-in
+COMPRESS_IMAGES = os.getenv("COMPRESS_UPLOAD_IMAGES", "false").lower() == "true"
+COMPRESS_THRESHOLD = int(os.getenv("COMPRESS_IMAGE_THRESHOLD", 1048576))  # 1MB
+COMPRESS_MAX_DIM = 1568  # matches vision-model tiling limits
+
+@lru_cache(maxsize=32)
+def _recompress_cached(path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Downscale and JPEG-re-encode a large image, returning base64
+
+    Returns None when Pillow is unavailable or re-encoding fails, so
+    callers fall back to the untouched original.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        import io
+        with Image.open(path) as img:
+            img = img.convert("RGB")
+            img.thumbnail((COMPRESS_MAX_DIM, COMPRESS_MAX_DIM))
+            buf = io.BytesIO()
+            img.save(buf, "JPEG", quality=85)
+        return base64.b64encode(buf.getvalue()).decode('ascii')
+    except Exception as e:
+        logger.warning(f"Image re-encode failed for {path}: {str(e)}")
+        return None
+
+@lru_cache(maxsize=1)
+def _month_year(today_ordinal: int):
+    """Month name and year, computed once per calendar day
+
+    strftime('%B') goes through C locale machinery on every call; keyed
+    on the date ordinal it runs at most once a day.
+    """
+    d = datetime.fromordinal(today_ordinal)
+    return d.strftime("%B"), d.year
+
+@lru_cache(maxsize=2)
+def _powerbi_updates_text(month: str, year: int) -> str:
+    """Power BI updates template, rebuilt only when the month changes"""
+    return f"""
+Current Power BI Information (as of {month} {year}):
+
+Microsoft regularly updates Power BI with new features and improvements. Recent updates typically include:
+
+• Enhanced AI capabilities and Copilot integration
+• New visualization types and custom visuals
+• Improved data connectivity options
+• Performance optimizations
+• Security and governance enhancements
+• Mobile app improvements
+
+For the most current and detailed information about Power BI updates:
+1. Visit the official Microsoft Power BI Blog: https://powerbi.microsoft.com/blog/
+2. Check Power BI Documentation: https://docs.microsoft.com/power-bi/
+3. Review the Power BI Release Notes: https://docs.microsoft.com/power-bi/fundamentals/desktop-latest-update
+
+Note: Power BI receives monthly updates with new features, and the service is continuously improved with cloud updates.
+"""
+
+_JSON_DECODER = json.JSONDecoder()
+
+def _extract_json(response: str, what: str) -> Dict:
+    """Parse the first complete JSON object out of a model reply
+
+    Clean replies hit orjson's C parser directly. Wrapped ones (prose,
+    ```json fences, trailing commentary) are scanned with raw_decode,
+    which walks the object once from the first '{' instead of re-parsing
+    a find/rfind slice - and doesn't break when the reply contains more
+    than one block.
+    """
+    try:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
+        pass
+
+    idx = response.find('{')
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(response, idx)
+            if isinstance(obj, dict):
+                return obj
+        except json.JSONDecodeError:
+            pass
+        idx = response.find('{', idx + 1)
+
+    raise ValueError(f"Could not parse AI response for {what}")
+
+def _pretty(obj) -> str:
+    """Indent-formatted JSON for prompts via orjson's C serializer
+
+    json.dumps with indent forces the slow pure-Python encoder path;
+    orjson's indented output is several times faster for the large
+    data_info/schema dicts embedded in prompts.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+@lru_cache(maxsize=128)
+def _encode_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read and base64-encode a file, cached by (path, mtime, size)
+
+    Users iterate on prompts over the same screenshot, and a fallback
+    from one provider to the other re-encodes the same upload; keying on
+    stat data means the file is read and encoded once until it changes.
+    """
+    with open(path, "rb") as image_file:
+        try:
+            # Encode straight from the page cache - no intermediate
+            # bytes copy of the whole file, so peak memory is roughly
+            # the base64 string instead of raw bytes plus the string
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return base64.b64encode(mm).decode('ascii')
+        except ValueError:  # empty file can't be mapped
+            return base64.b64encode(image_file.read()).decode('ascii')
+
 class AIClient:
+    # Image extensions as a tuple - str.endswith compares them all in
+    # one C call instead of a Python-level loop
+    _IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp')
+
+    # Extension -> MIME type, one dict lookup instead of a chain of
+    # lower().endswith branches per image
+    _EXT_TO_MIME = {
+        '.png': 'image/png',
+        '.jpg': 'image/jpeg',
+        '.jpeg': 'image/jpeg',
+        '.gif': 'image/gif',
+        '.bmp': 'image/bmp',
+        '.webp': 'image/webp',
+    }
+
+    # Static system prompt built once - both providers share it and only
+    # pay string interpolation when current_info is actually attached
+    _BASE_SYSTEM = """You are an expert Power BI dashboard designer and data analyst.
+You help users create professional dashboards by understanding their needs and providing detailed plans.
+Always provide helpful, accurate, and actionable responses.
+When analyzing images, describe what you see in detail and explain how it relates to data visualization or dashboard creation."""
+
+    # Circuit-breaker tuning
+    _BREAKER_THRESHOLD = 3
+    _BREAKER_COOLDOWN = 30.0
+
+    # One compiled alternation scans the message in a single pass instead
+    # of 17 separate substring searches over a lowercased copy
+    _CURRENT_INFO_RE = re.compile(
+        r"\b(?:latest|recent(?:ly)?|current|new(?:est)?|update(?:s)?|20(?:24|25)"
+        r"|this year|now|today|what'?s new|latest version|recent changes|current version)\b",
+        re.IGNORECASE
+    )
+
     def __init__(self):
         """
         Initialize AI client with OpenAI and Claude (Anthropic) support
@@ -23,29 +188,109 @@ class AIClient:
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         
+        # One warm connection pool shared by both SDKs - TLS handshakes
+        # happen once per connection instead of per request, and HTTP/2
+        # multiplexes many concurrent completions over each connection
+        self._sdk_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+            http2=True
+        )
+
         # Initialize clients
         if self.openai_api_key:
-            openai.api_key = self.openai_api_key
-            self.openai_client = openai.AsyncOpenAI(api_key=self.openai_api_key)
+            self.openai_client = openai.AsyncOpenAI(
+                api_key=self.openai_api_key,
+                http_client=self._sdk_http
+            )
             logger.info("OpenAI client initialized")
         else:
             self.openai_client = None
             logger.warning("OpenAI API key not found")
-            
+
         if self.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=self.anthropic_api_key)
+            # Async SDK - the old sync Anthropic client blocked the event
+            # loop for the whole generation when called from async code
+            self.anthropic_client = AsyncAnthropic(
+                api_key=self.anthropic_api_key,
+                http_client=self._sdk_http
+            )
             logger.info("Anthropic client initialized")
         else:
             self.anthropic_client = None
             logger.warning("Anthropic API key not found")
+
+        # Shared aiohttp session for web searches - created lazily on the
+        # running loop so TCP connections and DNS lookups are reused
+        self._http = None
+
+        # Per-provider circuit breakers: after _BREAKER_THRESHOLD
+        # consecutive failures a provider is skipped for
+        # _BREAKER_COOLDOWN seconds instead of hammering it (and
+        # cascading every failure onto the fallback provider)
+        self._breaker = {"openai": [0, 0.0], "anthropic": [0, 0.0]}
+
+        # Repeat "what's new" style queries are served from memory for
+        # 10 minutes; per-key locks coalesce concurrent identical queries
+        # so a burst triggers one DuckDuckGo round-trip, not N
+        self._search_cache = TTLCache(maxsize=256, ttl=600)
+        self._search_locks = {}
+
+        # Pre-warm connections so the first user request doesn't pay DNS
+        # + TCP + TLS (~200-500 ms); only possible when a loop is already
+        # running at construction time
+        try:
+            asyncio.get_running_loop().create_task(self._prewarm())
+        except RuntimeError:
+            # Constructed before the event loop starts (the usual case -
+            # the API server builds this at import time and schedules
+            # _prewarm from its startup hook instead)
+            pass
+
+    async def _prewarm(self):
+        """
+        Open keep-alive connections to the AI APIs ahead of first use
+        """
+        targets = []
+        if self.openai_client:
+            targets.append("https://api.openai.com/v1/models")
+        if self.anthropic_client:
+            targets.append("https://api.anthropic.com/v1/messages")
+
+        for url in targets:
+            try:
+                # Status doesn't matter (4xx is fine) - the point is the
+                # established connection left in the shared pool
+                await self._sdk_http.head(url)
+            except Exception as e:
+                logger.debug(f"Pre-warm for {url} failed: {e}")
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Create the shared HTTP session on first use
+        """
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10),
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+            )
+        return self._http
+
+    async def close(self):
+        """
+        Shut down the shared HTTP session and SDK connection pool
+        """
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+        if not self._sdk_http.is_closed:
+            await self._sdk_http.aclose()
     
     def _encode_image(self, image_path: str) -> str:
         """
         Encode image to base64 for AI processing
         """
         try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode('utf-8')
+            stat = os.stat(image_path)
+            return _encode_cached(image_path, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.error(f"Error encoding image {image_path}: {str(e)}")
             return None
@@ -54,8 +299,7 @@ class AIClient:
         """
         Check if file is an image
         """
-        image_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp']
-        return any(file_path.lower().endswith(ext) for ext in image_extensions)
+        return file_path.lower().endswith(self._IMAGE_EXTS)
     
     def _get_image_files_from_context(self, context: Optional[Dict] = None) -> List[str]:
         """
@@ -71,34 +315,120 @@ class AIClient:
         for file_path in uploaded_files:
             if self._is_image_file(file_path):
                 image_files.append(file_path)
-        
+
         return image_files
+
+    def _encode_images(self, image_files: List[str]) -> List[tuple]:
+        """
+        Encode images once as (media_type, base64) pairs
+
+        Called up front in get_response so both providers - and the
+        OpenAI-to-Anthropic fallback - reuse the same encoded payloads
+        instead of each re-encoding every image.
+        """
+        encoded = [self._encode_one(image_path) for image_path in image_files]
+        return [pair for pair in encoded if pair is not None]
+
+    def _encode_one(self, image_path: str) -> Optional[tuple]:
+        """
+        Encode a single image as a (media_type, base64) pair
+        """
+        media_type = self._mime(image_path)
+
+        # Opt-in: re-encode oversized lossless images as JPEG before
+        # base64 - far fewer bytes on the wire and vision tokens burned
+        if COMPRESS_IMAGES and media_type != 'image/jpeg':
+            try:
+                stat = os.stat(image_path)
+                if stat.st_size > COMPRESS_THRESHOLD:
+                    recoded = _recompress_cached(image_path, stat.st_mtime_ns, stat.st_size)
+                    if recoded:
+                        return ('image/jpeg', recoded)
+            except OSError:
+                pass
+
+        base64_image = self._encode_image(image_path)
+        if not base64_image:
+            return None
+
+        return (media_type, base64_image)
+
+    def _mime(self, path: str) -> str:
+        """
+        Resolve an image path to its MIME type
+        """
+        return self._EXT_TO_MIME.get(os.path.splitext(path)[1].lower(), 'image/jpeg')
+
+    def _system_content(self, context: Optional[Dict]) -> str:
+        """
+        Build the system prompt, appending current info when present
+        """
+        if context and context.get('current_info'):
+            return f"""{self._BASE_SYSTEM}
+
+CURRENT INFORMATION (as of {context.get('search_timestamp', 'now')}):
+{context['current_info']}
+
+Use this current information to provide up-to-date responses. Do not mention knowledge cutoff dates."""
+        return self._BASE_SYSTEM
+
+    async def _encode_images_parallel(self, image_files: List[str]) -> List[tuple]:
+        """
+        Encode images concurrently on worker threads
+
+        The GIL is released during the file read and the C-extension
+        encode, so multi-image prompts scale with cores - and the event
+        loop stays responsive while encoding runs.
+        """
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._encode_one, path) for path in image_files)
+        )
+        return [pair for pair in results if pair is not None]
     
     def _needs_current_info(self, message: str) -> bool:
         """
         Determine if the message requires current/recent information
         """
-        current_info_keywords = [
-            'latest', 'recent', 'current', 'new', 'update', 'updates', 'newest',
-            '2024', '2025', 'this year', 'recently', 'now', 'today',
-            'what\'s new', 'latest version', 'recent changes', 'current version'
-        ]
-        
-        message_lower = message.lower()
-        return any(keyword in message_lower for keyword in current_info_keywords)
+        return bool(self._CURRENT_INFO_RE.search(message))
     
     async def _search_web(self, query: str) -> str:
         """
-        Search the web for current information
+        Search the web for current information, with a short TTL cache
+        """
+        key = query.strip().lower()
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._search_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # A coalesced waiter may find the result already cached
+            cached = self._search_cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = await self._search_web_uncached(query)
+            self._search_cache[key] = result
+
+        self._search_locks.pop(key, None)
+        return result
+
+    async def _search_web_uncached(self, query: str) -> str:
+        """
+        Perform the actual web search round-trip
         """
         try:
-            # Use DuckDuckGo Instant Answer API (free, no API key required)
+            # Use DuckDuckGo Instant Answer API (free, no API key required).
+            # The shared async session keeps the event loop free during the
+            # round-trip - the old blocking requests.get stalled every other
+            # in-flight request for up to 10 s
             search_url = f"https://api.duckduckgo.com/?q={query}&format=json&no_html=1&skip_disambig=1"
-            
-            response = requests.get(search_url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                
+
+            session = await self._ensure_session()
+            async with session.get(search_url) as response:
+                data = await response.json(content_type=None) if response.status == 200 else None
+
+            if data is not None:
                 # Extract relevant information
                 result = ""
                 if data.get('Abstract'):
@@ -134,29 +464,10 @@ class AIClient:
         """
         try:
             # This would ideally scrape Microsoft's Power BI blog or documentation
-            # For now, we'll provide a template that encourages checking official sources
-            current_year = datetime.now().year
-            current_month = datetime.now().strftime("%B")
-            
-            return f"""
-Current Power BI Information (as of {current_month} {current_year}):
-
-Microsoft regularly updates Power BI with new features and improvements. Recent updates typically include:
-
-• Enhanced AI capabilities and Copilot integration
-• New visualization types and custom visuals
-• Improved data connectivity options
-• Performance optimizations
-• Security and governance enhancements
-• Mobile app improvements
-
-For the most current and detailed information about Power BI updates:
-1. Visit the official Microsoft Power BI Blog: https://powerbi.microsoft.com/blog/
-2. Check Power BI Documentation: https://docs.microsoft.com/power-bi/
-3. Review the Power BI Release Notes: https://docs.microsoft.com/power-bi/fundamentals/desktop-latest-update
-
-Note: Power BI receives monthly updates with new features, and the service is continuously improved with cloud updates.
-"""
+            # For now, we'll provide a template that encourages checking official
+            # sources - the text only changes monthly, so it's memoized
+            month, year = _month_year(datetime.today().toordinal())
+            return _powerbi_updates_text(month, year)
         except Exception as e:
             logger.warning(f"Failed to get Power BI updates: {str(e)}")
             return ""
@@ -166,32 +477,102 @@ Note: Power BI receives monthly updates with new features, and the service is co
         Get AI response using the best available model with current information when needed
         """
         try:
-            # Check if the message needs current information
-            current_info = ""
+            # Kick the web search off as a task so it overlaps with the
+            # request prep below instead of serializing in front of it
+            search_task = None
             if self._needs_current_info(message):
                 logger.info("Message requires current information, searching web...")
-                current_info = await self._search_web(message)
-            
-            # Add current information to context if found
+                search_task = asyncio.create_task(self._search_web(message))
+
             enhanced_context = context or {}
-            if current_info:
-                enhanced_context['current_info'] = current_info
-                enhanced_context['search_timestamp'] = datetime.now().isoformat()
-            
-            # Try OpenAI first (GPT-4)
-            if self.openai_client:
-                return await self._get_openai_response(message, conversation_id, enhanced_context)
-            
-            # Fallback to Anthropic (Claude)
-            elif self.anthropic_client:
-                return await self._get_anthropic_response(message, conversation_id, enhanced_context)
+
+            # Encode any context images exactly once for both providers,
+            # fanned out to worker threads so the loop stays free
+            image_files = self._get_image_files_from_context(enhanced_context)
+            if image_files:
+                enhanced_context['encoded_images'] = await self._encode_images_parallel(image_files)
+
+            # Collect the search result under a bounded budget - a slow
+            # DuckDuckGo lookup shouldn't hold up the model call
+            if search_task is not None:
+                try:
+                    current_info = await asyncio.wait_for(search_task, timeout=1.5)
+                except asyncio.TimeoutError:
+                    logger.info("Web search exceeded its budget, continuing without it")
+                    current_info = ""
+
+                if current_info:
+                    enhanced_context['current_info'] = current_info
+                    enhanced_context['search_timestamp'] = datetime.now().isoformat()
             
-            else:
+            if not self.openai_client and not self.anthropic_client:
                 raise ValueError("No AI API keys configured. Please add OPENAI_API_KEY or ANTHROPIC_API_KEY to your .env file.")
-                
+
+            # Try OpenAI first (GPT-4), unless its breaker is open
+            if self.openai_client and not self._breaker_open("openai"):
+                try:
+                    result = await self._openai_with_retry(message, conversation_id, enhanced_context)
+                    self._record_result("openai", True)
+                    return result
+                except (openai.AuthenticationError, openai.BadRequestError):
+                    # Misconfiguration - neither retry nor fallback helps
+                    raise
+                except Exception as e:
+                    self._record_result("openai", False)
+                    if not self.anthropic_client:
+                        raise
+                    logger.warning(f"OpenAI failed, falling back to Anthropic: {str(e)}")
+
+            # Fallback to Anthropic (Claude)
+            if self.anthropic_client and not self._breaker_open("anthropic"):
+                try:
+                    result = await self._get_anthropic_response(message, conversation_id, enhanced_context)
+                    self._record_result("anthropic", True)
+                    return result
+                except Exception:
+                    self._record_result("anthropic", False)
+                    raise
+
+            raise RuntimeError("No AI provider currently available (circuit breakers open after repeated failures).")
+
         except Exception as e:
             logger.error(f"Error getting AI response: {str(e)}")
             raise e
+
+    def _breaker_open(self, provider: str) -> bool:
+        """
+        Check whether a provider's circuit breaker is currently open
+        """
+        failures, opened_at = self._breaker[provider]
+        return (
+            failures >= self._BREAKER_THRESHOLD
+            and (time.monotonic() - opened_at) < self._BREAKER_COOLDOWN
+        )
+
+    def _record_result(self, provider: str, success: bool):
+        """
+        Track consecutive failures per provider for the circuit breaker
+        """
+        if success:
+            self._breaker[provider] = [0, 0.0]
+        else:
+            self._breaker[provider] = [self._breaker[provider][0] + 1, time.monotonic()]
+
+    async def _openai_with_retry(self, message: str, conversation_id: str, context: Optional[Dict]) -> str:
+        """
+        Call OpenAI, retrying once on a rate limit using its retry-after
+        """
+        try:
+            return await self._get_openai_response(message, conversation_id, context)
+        except openai.RateLimitError as e:
+            retry_after = 1.0
+            try:
+                retry_after = float(e.response.headers.get("retry-after", retry_after))
+            except (AttributeError, TypeError, ValueError):
+                pass
+            logger.warning(f"OpenAI rate limited, retrying in {retry_after:.1f}s")
+            await asyncio.sleep(min(retry_after, 10.0))
+            return await self._get_openai_response(message, conversation_id, context)
     
     async def analyze_dashboard_request(self, user_request: str, data_info: Dict) -> Dict:
         """
@@ -203,7 +584,7 @@ You are an expert Power BI dashboard designer. Analyze this request and data to
 USER REQUEST: {user_request}
 
 DATA INFORMATION:
-{json.dumps(data_info, indent=2)}
+{_pretty(data_info)}
 
 Create a comprehensive dashboard plan in JSON format with these components:
 
@@ -256,18 +637,9 @@ Make sure the plan uses the actual field names from the data and creates a profe
             else:
                 raise ValueError("No AI API keys configured. Cannot analyze dashboard request without AI integration.")
             
-            # Try to parse JSON response
-            try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                # Extract JSON from response if it's wrapped in text
-                start = response.find('{')
-                end = response.rfind('}') + 1
-                if start >= 0 and end > start:
-                    return json.loads(response[start:end])
-                else:
-                    raise ValueError("Could not parse AI response for dashboard analysis")
-                    
+            # Parse JSON response, tolerating wrapping text
+            return _extract_json(response, "dashboard analysis")
+
         except Exception as e:
             logger.error(f"Error analyzing dashboard request: {str(e)}")
             raise e
@@ -280,10 +652,10 @@ Make sure the plan uses the actual field names from the data and creates a profe
 You are a Power BI DAX expert. Generate DAX formulas for this dashboard.
 
 DASHBOARD PLAN:
-{json.dumps(dashboard_plan, indent=2)}
+{_pretty(dashboard_plan)}
 
 DATA SCHEMA:
-{json.dumps(data_schema, indent=2)}
+{_pretty(data_schema)}
 
 Create DAX formulas in JSON format:
 
@@ -315,17 +687,9 @@ Generate proper DAX syntax using the actual table and column names from the sche
             else:
                 raise ValueError("No AI API keys configured. Cannot generate DAX formulas without AI integration.")
             
-            # Parse JSON response
-            try:
-                return json.loads(response)
-            except json.JSONDecodeError:
-                start = response.find('{')
-                end = response.rfind('}') + 1
-                if start >= 0 and end > start:
-                    return json.loads(response[start:end])
-                else:
-                    raise ValueError("Could not parse AI response for DAX generation")
-                    
+            # Parse JSON response, tolerating wrapping text
+            return _extract_json(response, "DAX generation")
+
         except Exception as e:
             logger.error(f"Error generating DAX formulas: {str(e)}")
             raise e
@@ -336,20 +700,8 @@ Generate proper DAX syntax using the actual table and column names from the sche
         """
         try:
             # Build system message with current information if available
-            system_content = """You are an expert Power BI dashboard designer and data analyst. 
-You help users create professional dashboards by understanding their needs and providing detailed plans.
-Always provide helpful, accurate, and actionable responses.
-When analyzing images, describe what you see in detail and explain how it relates to data visualization or dashboard creation."""
-            
-            # Add current information to system message if available
-            if context and context.get('current_info'):
-                system_content += f"""
-
-CURRENT INFORMATION (as of {context.get('search_timestamp', 'now')}):
-{context['current_info']}
+            system_content = self._system_content(context)
 
-Use this current information to provide up-to-date responses. Do not mention knowledge cutoff dates."""
-            
             messages = [
                 {
                     "role": "system",
@@ -357,33 +709,27 @@ Use this current information to provide up-to-date responses. Do not mention kno
                 }
             ]
             
-            # Check for images in context
-            image_files = self._get_image_files_from_context(context)
-            
-            if image_files:
+            # Use pre-encoded images from get_response when present;
+            # direct callers (dashboard analysis, DAX) encode on demand
+            encoded_images = (context or {}).get('encoded_images')
+            if encoded_images is None:
+                encoded_images = self._encode_images(
+                    self._get_image_files_from_context(context)
+                )
+
+            if encoded_images:
                 # Create user message with images
                 user_content = [{"type": "text", "text": message}]
-                
-                for image_path in image_files:
-                    base64_image = self._encode_image(image_path)
-                    if base64_image:
-                        # Determine image type
-                        image_type = "jpeg"
-                        if image_path.lower().endswith('.png'):
-                            image_type = "png"
-                        elif image_path.lower().endswith('.gif'):
-                            image_type = "gif"
-                        elif image_path.lower().endswith('.webp'):
-                            image_type = "webp"
-                        
-                        user_content.append({
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/{image_type};base64,{base64_image}",
-                                "detail": "high"
-                            }
-                        })
-                
+
+                for media_type, base64_image in encoded_images:
+                    user_content.append({
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{media_type};base64,{base64_image}",
+                            "detail": "high"
+                        }
+                    })
+
                 messages.append({
                     "role": "user",
                     "content": user_content
@@ -394,18 +740,27 @@ Use this current information to provide up-to-date responses. Do not mention kno
                     "role": "user",
                     "content": message
                 })
-            
+
             # Use vision model if images are present
-            model = "gpt-4o" if image_files else "gpt-4-turbo-preview"
+            model = "gpt-4o" if encoded_images else "gpt-4-turbo-preview"
             
-            response = await self.openai_client.chat.completions.create(
+            # Stream the reply and join once at the end - bytes start
+            # flowing as soon as generation begins instead of after the
+            # whole completion is buffered server-side
+            stream = await self.openai_client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=0.7,
-                max_tokens=2000
+                max_tokens=2000,
+                stream=True
             )
-            
-            return response.choices[0].message.content
+
+            parts = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"Error with OpenAI: {str(e)}")
@@ -416,52 +771,37 @@ Use this current information to provide up-to-date responses. Do not mention kno
         Get response from Anthropic Claude
         """
         try:
-            # Check for images in context
-            image_files = self._get_image_files_from_context(context)
-            
-            # Build system message
-            system_content = """You are an expert Power BI dashboard designer and data analyst. 
-You help users create professional dashboards by understanding their needs and providing detailed plans.
-Always provide helpful, accurate, and actionable responses.
-When analyzing images, describe what you see in detail and explain how it relates to data visualization or dashboard creation."""
-            
-            # Add current information if available
-            if context and context.get('current_info'):
-                system_content += f"""
+            # Use pre-encoded images from get_response when present;
+            # direct callers (dashboard analysis, DAX) encode on demand
+            encoded_images = (context or {}).get('encoded_images')
+            if encoded_images is None:
+                encoded_images = self._encode_images(
+                    self._get_image_files_from_context(context)
+                )
 
-CURRENT INFORMATION (as of {context.get('search_timestamp', 'now')}):
-{context['current_info']}
+            # Build system message with current information if available
+            system_content = self._system_content(context)
 
-Use this current information to provide up-to-date responses. Do not mention knowledge cutoff dates."""
-            
             # Build user content with images if present
-            if image_files:
+            if encoded_images:
                 user_content = [{"type": "text", "text": message}]
-                
-                for image_path in image_files:
-                    base64_image = self._encode_image(image_path)
-                    if base64_image:
-                        # Determine media type
-                        media_type = "image/jpeg"
-                        if image_path.lower().endswith('.png'):
-                            media_type = "image/png"
-                        elif image_path.lower().endswith('.gif'):
-                            media_type = "image/gif"
-                        elif image_path.lower().endswith('.webp'):
-                            media_type = "image/webp"
-                        
-                        user_content.append({
-                            "type": "image",
-                            "source": {
-                                "type": "base64",
-                                "media_type": media_type,
-                                "data": base64_image
-                            }
-                        })
+
+                for media_type, base64_image in encoded_images:
+                    user_content.append({
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": media_type,
+                            "data": base64_image
+                        }
+                    })
             else:
                 user_content = message
             
-            response = self.anthropic_client.messages.create(
+            # Stream the reply and join once at the end - same rationale
+            # as the OpenAI path
+            parts = []
+            async with self.anthropic_client.messages.stream(
                 model="claude-3-sonnet-20240229",
                 max_tokens=2000,
                 system=system_content,
@@ -471,9 +811,11 @@ Use this current information to provide up-to-date responses. Do not mention kno
                         "content": user_content
                     }
                 ]
-            )
-            
-            return response.content[0].text
+            ) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"Error with Anthropic: {str(e)}")
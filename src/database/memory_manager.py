@@ -1,7 +1,7 @@
 import json
 import os
 import sqlite3
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import logging
 import asyncio
@@ -95,6 +95,18 @@ class MemoryManager:
                     )
                 ''')
                 
+                # Create jobs table - dashboard job state lives here (not
+                # in process memory) so status polling works with workers > 1
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        job_id TEXT PRIMARY KEY,
+                        conversation_id TEXT,
+                        data TEXT NOT NULL,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (conversation_id) REFERENCES conversations (id)
+                    )
+                ''')
+
                 conn.commit()
                 logger.info("Database initialized successfully")
                 
@@ -135,15 +147,96 @@ class MemoryManager:
         except Exception as e:
             logger.error(f"Error adding message: {str(e)}")
     
+    def add_messages_bulk(self, conversation_id: str, messages: List[Tuple[str, str]]):
+        """
+        Add several messages to the conversation in one transaction
+
+        Each add_message call pays a separate SQLite connect + commit
+        (fsync-bound); batching progress updates through here turns N
+        writes into one.
+        """
+        if not messages:
+            return
+
+        try:
+            now_iso = datetime.now().isoformat()
+
+            # Add to in-memory cache
+            if conversation_id not in self.conversations:
+                first_role, first_content = messages[0]
+                self.conversations[conversation_id] = {
+                    "id": conversation_id,
+                    "messages": [],
+                    "created_at": now_iso,
+                    "updated_at": now_iso,
+                    "title": self._generate_conversation_title(first_content) if first_role == "user" else "New Conversation"
+                }
+
+            self.conversations[conversation_id]["messages"].extend(
+                {"role": role, "content": content, "timestamp": now_iso, "metadata": {}}
+                for role, content in messages
+            )
+            self.conversations[conversation_id]["updated_at"] = now_iso
+
+            # Persist to database - one connection, one commit
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+
+                # Ensure conversation exists
+                first_role, first_content = messages[0]
+                cursor.execute(
+                    "INSERT OR IGNORE INTO conversations (id, title) VALUES (?, ?)",
+                    (conversation_id, self._generate_conversation_title(first_content) if first_role == "user" else "New Conversation")
+                )
+
+                # Update conversation timestamp
+                cursor.execute(
+                    "UPDATE conversations SET updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (conversation_id,)
+                )
+
+                # Insert all messages in one batch
+                cursor.executemany('''
+                    INSERT INTO messages (conversation_id, role, content, metadata)
+                    VALUES (?, ?, ?, ?)
+                ''', [
+                    (conversation_id, role, content, None)
+                    for role, content in messages
+                ])
+
+                conn.commit()
+
+            logger.info(f"Added {len(messages)} messages to conversation {conversation_id}")
+
+        except Exception as e:
+            logger.error(f"Error adding messages in bulk: {str(e)}")
+
     def get_conversation(self, conversation_id: str) -> Dict:
         """
         Get conversation history
         """
         try:
-            # Try in-memory cache first
-            if conversation_id in self.conversations:
-                return self.conversations[conversation_id]
-            
+            # Try in-memory cache first - but with multiple workers other
+            # processes append messages this cache never sees, so only
+            # trust it while the DB doesn't hold more messages than we do
+            cached = self.conversations.get(conversation_id)
+            if cached is not None:
+                try:
+                    with sqlite3.connect(self.db_path) as conn:
+                        cursor = conn.cursor()
+                        cursor.execute(
+                            'SELECT COUNT(*) FROM messages WHERE conversation_id = ?',
+                            (conversation_id,)
+                        )
+                        db_count = cursor.fetchone()[0]
+                except Exception:
+                    return cached
+
+                if db_count <= len(cached["messages"]):
+                    return cached
+                # Another worker wrote newer messages - drop and reload
+                del self.conversations[conversation_id]
+
             # Load from database
             conversation = self._load_conversation_from_db(conversation_id)
             if conversation:
@@ -549,6 +642,77 @@ class MemoryManager:
             logger.error(f"Error generating conversation title: {str(e)}")
             return "New Conversation"
     
+    def create_job(self, job_id: str, conversation_id: str, status: str = "starting", progress: int = 0) -> Dict:
+        """
+        Create a dashboard job record, expiring stale jobs as a side effect
+        """
+        job = {
+            "status": status,
+            "progress": progress,
+            "conversation_id": conversation_id
+        }
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    DELETE FROM jobs
+                    WHERE updated_at < datetime('now', '-' || ? || ' seconds')
+                ''', (int(os.getenv("JOB_TTL_SECONDS", 3600)),))
+                cursor.execute('''
+                    INSERT OR REPLACE INTO jobs (job_id, conversation_id, data, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (job_id, conversation_id, json.dumps(job)))
+                conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error creating job {job_id}: {str(e)}")
+
+        return job
+
+    def update_job(self, job_id: str, **fields):
+        """
+        Merge fields into an existing job record
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return
+
+                job = json.loads(row[0])
+                job.update(fields)
+
+                cursor.execute('''
+                    UPDATE jobs
+                    SET data = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE job_id = ?
+                ''', (json.dumps(job), job_id))
+                conn.commit()
+
+        except Exception as e:
+            logger.error(f"Error updating job {job_id}: {str(e)}")
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        Get a dashboard job record by ID
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT data FROM jobs WHERE job_id = ?', (job_id,))
+                row = cursor.fetchone()
+
+                if row:
+                    return json.loads(row[0])
+                return None
+
+        except Exception as e:
+            logger.error(f"Error getting job {job_id}: {str(e)}")
+            return None
+
     def cleanup_old_conversations(self, days_old: int = 30):
         """
         Clean up old conversations
@@ -93,6 +93,69 @@ class FileValidator:
             logger.error(f"Error validating file {original_filename}: {e}")
             return False, f"Validation error: {str(e)}"
     
+    @classmethod
+    def validate_header(cls, head: bytes, original_filename: str) -> Tuple[bool, str]:
+        """
+        Validate an upload from its first bytes and filename only
+
+        Runs before the file is committed to disk, so rejected uploads
+        never cost a full write.
+
+        Args:
+            head: The first bytes of the upload
+            original_filename: Original filename from upload
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        try:
+            if not head:
+                return False, "File is empty"
+
+            # Check file extension
+            file_ext = Path(original_filename).suffix.lower()
+            if file_ext not in cls.ALLOWED_EXTENSIONS:
+                return False, f"File extension '{file_ext}' is not allowed. Allowed extensions: {list(cls.ALLOWED_EXTENSIONS.keys())}"
+
+            # Check MIME type
+            mime_type, _ = mimetypes.guess_type(original_filename)
+            allowed_mimes = cls.ALLOWED_EXTENSIONS[file_ext]
+            if mime_type and mime_type not in allowed_mimes:
+                return False, f"MIME type '{mime_type}' is not allowed for extension '{file_ext}'"
+
+            # Check for dangerous patterns in filename
+            for pattern in cls.DANGEROUS_PATTERNS:
+                if re.search(pattern, original_filename, re.IGNORECASE):
+                    return False, f"Filename contains dangerous pattern: {pattern}"
+
+            # Additional security checks
+            if not cls._is_safe_filename(original_filename):
+                return False, "Filename contains invalid characters"
+
+            return True, "File is valid"
+
+        except Exception as e:
+            logger.error(f"Error validating file header {original_filename}: {e}")
+            return False, f"Validation error: {str(e)}"
+
+    @classmethod
+    def validate_single(cls, file_path: str, original_filename: str) -> Tuple[bool, List[str]]:
+        """
+        Validate one on-disk file, returning errors in list form
+
+        Thread-pool friendly wrapper so callers can fan per-file
+        validation out with asyncio.to_thread and aggregate the results.
+
+        Args:
+            file_path: Path to the uploaded file
+            original_filename: Original filename from upload
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        is_valid, error_msg = cls.validate_file(file_path, original_filename)
+        return is_valid, [] if is_valid else [f"{original_filename}: {error_msg}"]
+
     @classmethod
     def validate_multiple_files(cls, files: List[Tuple[str, str]]) -> Tuple[bool, List[str]]:
         """